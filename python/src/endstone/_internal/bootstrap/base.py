@@ -220,7 +220,9 @@ class Bootstrap:
         user_base = str((self.plugin_path / ".local").resolve().absolute())
         shutil.rmtree(user_base, ignore_errors=True)
 
-        env = kwargs.pop("env", os.environ.copy())
+        env = kwargs.pop("env", None)
+        if env is None:
+            env = dict(os.environ)
         env["PYTHONUSERBASE"] = user_base
         env["PATH"] = os.pathsep.join(sys.path)
         env["PYTHONPATH"] = os.pathsep.join(sys.path)
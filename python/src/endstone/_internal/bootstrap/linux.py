@@ -1,4 +1,5 @@
 import ctypes.util
+import functools
 import os
 import stat
 from pathlib import Path
@@ -6,6 +7,31 @@ from pathlib import Path
 from endstone._internal.bootstrap.base import Bootstrap
 
 
+class DlInfo(ctypes.Structure):
+    # https://www.man7.org/linux/man-pages/man3/dladdr.3.html
+    _fields_ = [
+        ("dli_fname", ctypes.c_char_p),
+        ("dli_fbase", ctypes.c_void_p),
+        ("dli_sname", ctypes.c_char_p),
+        ("dli_saddr", ctypes.c_void_p),
+    ]
+
+
+@functools.cache
+def _libdl() -> ctypes.CDLL:
+    libdl = ctypes.CDLL(ctypes.util.find_library("dl"))
+    libdl.dladdr.argtypes = [ctypes.c_void_p, ctypes.POINTER(DlInfo)]
+    libdl.dladdr.restype = ctypes.c_int
+    return libdl
+
+
+def _resolve_if_symlink(path: str) -> Path:
+    # the loader reports absolute paths; only pay for a full resolve() when there is a link to follow
+    if os.path.islink(path):
+        return Path(path).resolve()
+    return Path(path)
+
+
 class LinuxBootstrap(Bootstrap):
     @property
     def name(self) -> str:
@@ -29,12 +55,14 @@ class LinuxBootstrap(Bootstrap):
         os.chmod(self.executable_path, st.st_mode | stat.S_IEXEC)
 
     def _create_process(self, *args, **kwargs) -> None:
-        env = os.environ.copy()
-        env["LD_PRELOAD"] = str(self._endstone_runtime_path.absolute())
-        env["LD_LIBRARY_PATH"] = str(self._linked_libpython_path.parent.absolute())
+        env = {
+            **os.environ,
+            "LD_PRELOAD": str(self._endstone_runtime_path.absolute()),
+            "LD_LIBRARY_PATH": str(self._linked_libpython_path.parent.absolute()),
+        }
         super()._create_process(env=env)
 
-    @property
+    @functools.cached_property
     def _linked_libpython_path(self) -> Path:
         """
         Find the path of the linked libpython on Unix systems.
@@ -45,23 +73,25 @@ class LinuxBootstrap(Bootstrap):
             (Path): Path object representing the path of the linked libpython.
         """
 
-        class DlInfo(ctypes.Structure):
-            # https://www.man7.org/linux/man-pages/man3/dladdr.3.html
-            _fields_ = [
-                ("dli_fname", ctypes.c_char_p),
-                ("dli_fbase", ctypes.c_void_p),
-                ("dli_sname", ctypes.c_char_p),
-                ("dli_saddr", ctypes.c_void_p),
-            ]
+        # Fast path: the kernel already lists every mapped shared object in /proc/self/maps
+        try:
+            with open("/proc/self/maps", "rb") as f:
+                for line in f:
+                    fields = line.split(maxsplit=5)
+                    if len(fields) < 6:
+                        continue
 
-        libdl = ctypes.CDLL(ctypes.util.find_library("dl"))
-        libdl.dladdr.argtypes = [ctypes.c_void_p, ctypes.POINTER(DlInfo)]
-        libdl.dladdr.restype = ctypes.c_int
+                    pathname = fields[5].rstrip()
+                    filename = os.path.basename(pathname)
+                    if pathname.startswith(b"/") and filename.startswith(b"libpython") and b".so" in filename:
+                        return _resolve_if_symlink(os.fsdecode(pathname))
+        except OSError:
+            pass
 
+        # Fall back to asking the dynamic linker which object defines Py_GetVersion
         dlinfo = DlInfo()
-        retcode = libdl.dladdr(ctypes.cast(ctypes.pythonapi.Py_GetVersion, ctypes.c_void_p), ctypes.pointer(dlinfo))
+        retcode = _libdl().dladdr(ctypes.cast(ctypes.pythonapi.Py_GetVersion, ctypes.c_void_p), ctypes.pointer(dlinfo))
         if retcode == 0:
             raise ValueError("dladdr cannot match the address of ctypes.pythonapi.Py_GetVersion to a shared object")
 
-        path = Path(dlinfo.dli_fname.decode()).resolve()
-        return path
+        return _resolve_if_symlink(dlinfo.dli_fname.decode())
@@ -1,9 +1,6 @@
-import glob
+import functools
 import os.path
-import site
-import subprocess
 import sys
-from importlib_metadata import entry_points, metadata
 from typing import List
 from endstone import Server
 from endstone.command import Command
@@ -13,7 +10,39 @@ from endstone.plugin import PluginDescription, PluginLoader, Plugin, PluginLoadO
 __all__ = ["PythonPluginLoader"]
 
 
-def find_python():
+def _build_enum_lookup(members) -> dict:
+    # accept both "NOT_OP" and "NOT OP" so user input only needs to be stripped and upper-cased
+    lookup = dict(members)
+    lookup.update({k.replace("_", " "): v for k, v in members.items()})
+    return lookup
+
+
+_PERMISSION_DEFAULT_BY_NAME = _build_enum_lookup(PermissionDefault.__members__)
+_PLUGIN_LOAD_ORDER_BY_NAME = _build_enum_lookup(PluginLoadOrder.__members__)
+
+# class attributes of a plugin that are forwarded to its PluginDescription
+_PLUGIN_DESCRIPTION_FIELDS = (
+    "name",
+    "version",
+    "api_version",
+    "description",
+    "load",
+    "authors",
+    "contributors",
+    "website",
+    "prefix",
+    "provides",
+    "depend",
+    "soft_depend",
+    "load_before",
+    "commands",
+    "default_permission",
+    "permissions",
+)
+
+
+@functools.cache
+def find_python() -> str:
     if sys.platform == "win32":
         path = os.path.join(sys.prefix, "python.exe")
     else:
@@ -25,8 +54,22 @@ def find_python():
     raise RuntimeError("Unable to find Python executable")
 
 
+@functools.cache
+def _endstone_entry_points():
+    from importlib_metadata import entry_points
+
+    return tuple(entry_points(group="endstone"))
+
+
+@functools.cache
+def _dist_metadata_json(dist_name: str) -> dict:
+    from importlib_metadata import metadata
+
+    return metadata(dist_name).json
+
+
 class PythonPluginLoader(PluginLoader):
-    SUPPORTED_API = ["0.2", "0.3", "0.4"]
+    SUPPORTED_API = frozenset(("0.2", "0.3", "0.4"))
 
     def __init__(self, server: Server):
         PluginLoader.__init__(self, server)
@@ -34,57 +77,90 @@ class PythonPluginLoader(PluginLoader):
 
     @staticmethod
     def _build_commands(commands: dict) -> list[Command]:
-        results = []
-        for name, command in commands.items():
-            command = Command(name, **command)
-            results.append(command)
-        return results
+        return [Command(name, **command) for name, command in commands.items()]
 
     @staticmethod
     def _build_permissions(permissions: dict) -> list[Permission]:
         results = []
         for name, permission in permissions.items():
-            if "default" in permission:
-                value = permission["default"]
-                if isinstance(value, bool):
-                    permission["default"] = PermissionDefault.TRUE if value else PermissionDefault.FALSE
-                elif isinstance(value, str):
-                    permission["default"] = PermissionDefault.__members__[value.strip().replace(" ", "_").upper()]
-                elif not isinstance(value, PermissionDefault):
-                    raise TypeError(f"Invalid value for default permission: {value}")
-
-            permission = Permission(name, **permission)
-            results.append(permission)
+            # work on a copy so the plugin's class attributes are left untouched
+            kwargs = dict(permission)
+            value = kwargs.get("default")
+            if isinstance(value, bool):
+                kwargs["default"] = PermissionDefault.TRUE if value else PermissionDefault.FALSE
+            elif isinstance(value, str):
+                kwargs["default"] = _PERMISSION_DEFAULT_BY_NAME[value.strip().upper()]
+            elif value is not None and not isinstance(value, PermissionDefault):
+                raise TypeError(f"Invalid value for default permission: {value}")
+
+            results.append(Permission(name, **kwargs))
         return results
 
     def load_plugins(self, directory) -> List[Plugin]:
-        env = os.environ.copy()
-        env.pop("LD_PRELOAD", "")
-
-        for file in glob.glob(os.path.join(directory, "*.whl")):
-            subprocess.run(
-                [
-                    find_python(),
-                    "-m",
-                    "pip",
-                    "install",
-                    file,
-                    "--user",
-                    "--quiet",
-                    "--no-warn-script-location",
-                ],
-                env=env,
-            )
+        # deferred so that importing the loader stays cheap
+        import site
+        import subprocess
+        from concurrent.futures import ThreadPoolExecutor
+
+        wheels = []
+        if os.path.isdir(directory):
+            with os.scandir(directory) as it:
+                # skip dotfiles (e.g. macOS AppleDouble "._*.whl" files) just like glob("*.whl") did
+                wheels = [
+                    entry.path
+                    for entry in it
+                    if entry.is_file() and entry.name.endswith(".whl") and not entry.name.startswith(".")
+                ]
+
+        if wheels:
+            env = {k: v for k, v in os.environ.items() if k != "LD_PRELOAD"}
+
+            def pip_install(*files: str) -> int:
+                return subprocess.run(
+                    [
+                        find_python(),
+                        "-m",
+                        "pip",
+                        "install",
+                        *files,
+                        "--user",
+                        "--quiet",
+                        "--no-warn-script-location",
+                        # skip pip's self-update check against PyPI; dependency resolution stays enabled
+                        # because plugin wheels may declare requirements that are not installed yet
+                        "--disable-pip-version-check",
+                    ],
+                    env=env,
+                    stdin=subprocess.DEVNULL,
+                ).returncode
+
+            # install all wheels with a single pip invocation to pay its startup cost only once. pip installs
+            # nothing if any of them fails, so fall back to installing them one by one to keep plugins isolated.
+            if pip_install(*wheels) != 0:
+                self.server.logger.warning("Failed to install plugin wheels in a single batch, retrying one by one.")
+                for wheel in wheels:
+                    if pip_install(wheel) != 0:
+                        self.server.logger.error(f"Error occurred when trying to install plugin wheel '{wheel}'.")
+
+            # newly installed distributions are not visible through the cached lookups
+            _endstone_entry_points.cache_clear()
+            _dist_metadata_json.cache_clear()
 
         user_site_packages = site.getusersitepackages()
         if user_site_packages not in sys.path:
             sys.path.insert(0, user_site_packages)
 
         loaded_plugins = []
-        eps = entry_points(group="endstone")
-        for ep in eps:
+        eps = _endstone_entry_points()
+        # prefetch distribution metadata concurrently; plugin modules are still imported on this thread
+        executor = ThreadPoolExecutor(max_workers=min(8, len(eps) or 1))
+        metadata_futures = [executor.submit(_dist_metadata_json, ep.dist.name) for ep in eps]
+        # queued lookups still run to completion, the worker threads exit once they are done
+        executor.shutdown(wait=False)
+        for ep, metadata_future in zip(eps, metadata_futures):
             # enforce naming convention
-            if not ep.dist.name.replace("_", "-").startswith("endstone-"):
+            normalized_dist_name = ep.dist.name.replace("_", "-")
+            if not normalized_dist_name.startswith("endstone-"):
                 self.server.logger.error(
                     f"Error occurred when trying to load plugin from entry point '{ep.name}': Invalid name.")
                 self.server.logger.error(
@@ -92,7 +168,7 @@ class PythonPluginLoader(PluginLoader):
                 continue
 
             dist_name = "endstone-" + ep.name.replace("_", "-")
-            if ep.dist.name.replace("_", "-") != dist_name:
+            if normalized_dist_name != dist_name:
                 self.server.logger.error(
                     f"Error occurred when trying to load plugin from entry point '{ep.name}': Invalid name.")
                 self.server.logger.error(f"You need to make **ONE** of the following changes.")
@@ -104,14 +180,14 @@ class PythonPluginLoader(PluginLoader):
 
             # get distribution metadata
             try:
-                plugin_metadata = metadata(ep.dist.name).json
+                plugin_metadata = metadata_future.result()
                 cls = ep.load()
             except Exception as e:
                 self.server.logger.error(f"Error occurred when trying to load plugin from entry point '{ep.name}': {e}")
                 continue
 
             # prepare plugin description
-            cls_attr = dict(cls.__dict__)
+            cls_attr = {k: cls.__dict__[k] for k in _PLUGIN_DESCRIPTION_FIELDS if k in cls.__dict__}
             name = cls_attr.pop("name", ep.name.replace("-", "_"))
             version = cls_attr.pop("version", plugin_metadata["version"])
 
@@ -131,10 +207,15 @@ class PythonPluginLoader(PluginLoader):
             load = cls_attr.pop("load", None)
             if load is not None:
                 if isinstance(load, str):
-                    load = PluginLoadOrder.__members__[load.strip().replace(" ", "_").upper()]
+                    load = _PLUGIN_LOAD_ORDER_BY_NAME[load.strip().upper()]
                 elif not isinstance(load, PluginLoadOrder):
                     raise TypeError(f"Invalid value for load order: {load}")
 
+            # instantiate plugin before building the rest of its description
+            plugin = cls()
+            if not isinstance(plugin, Plugin):
+                raise TypeError(f"Main class {ep.value} does not extend endstone.plugin.Plugin")
+
             description = cls_attr.pop("description", plugin_metadata.get("summary", None))
             authors = cls_attr.pop("authors", plugin_metadata.get("author_email", "").split(","))
             website = cls_attr.pop("website", "; ".join(plugin_metadata.get("project_url", [])))
@@ -145,17 +226,12 @@ class PythonPluginLoader(PluginLoader):
             permissions = cls_attr.pop("permissions", {})
             permissions = self._build_permissions(permissions)
 
-            plugin_description = PluginDescription(
+            plugin._description = PluginDescription(
                 name=name, version=version, load=load, description=description, authors=authors, website=website,
                 commands=commands, permissions=permissions, **cls_attr
             )
-
-            # instantiate plugin
-            plugin = cls()
-            if not isinstance(plugin, Plugin):
-                raise TypeError(f"Main class {ep.value} does not extend endstone.plugin.Plugin")
-            plugin._description = plugin_description
-            self._plugins.append(plugin)
             loaded_plugins.append(plugin)
 
+        # keep the Python objects alive, the server only holds raw pointers to them
+        self._plugins.extend(loaded_plugins)
         return loaded_plugins